@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures for the Python route tests
+Constant test data is built once per session and frozen so tests cannot mutate it
+"""
+from types import MappingProxyType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mock_jwt():
+    """Simulated JWT token (from auth.js middleware)"""
+    return "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpZCI6IjUwN2YxZjc3YmNmODZjZDc5OTQzOTAxMSIsInVzZXJuYW1lIjoidGVzdHVzZXIiLCJyb2xlIjoidXNlciIsImlhdCI6MTcwNDA5NjAwMCwiZXhwIjoxNzA0MTgyNDAwfQ.signature"
+
+
+@pytest.fixture(scope="session")
+def api_errors():
+    """API error responses handled across frontend components"""
+    return tuple(MappingProxyType(error) for error in [
+        {
+            "status": 400,
+            "message": "Validation error",
+            "errors": ["Username is required"]
+        },
+        {
+            "status": 401,
+            "message": "Authentication required",
+            "code": "AUTH_REQUIRED"
+        },
+        {
+            "status": 403,
+            "message": "Insufficient permissions",
+            "code": "INSUFFICIENT_PERMISSIONS"
+        },
+        {
+            "status": 404,
+            "message": "Resource not found",
+            "code": "NOT_FOUND"
+        },
+        {
+            "status": 500,
+            "message": "Internal server error",
+            "code": "INTERNAL_ERROR"
+        }
+    ])
@@ -2,373 +2,20 @@
 Python tests for frontend integration and API service behaviors
 Tests the expected interactions between frontend components and backend APIs
 """
-from test_helpers import validate_response_format, create_mock_request_data, format_test_result
-from test_utilities import simulate_api_response, generate_test_user_data, check_required_fields, log_test_execution
-from datetime import datetime
-import json
+from test_helpers import check_required_fields
 
 
-def test_api_service_structure():
-    """Test expected API service structure (from ApiService.ts)"""
-    # Test API service base configuration
-    api_config = {
-        "baseURL": "http://localhost:3000/api",
-        "timeout": 5000,
-        "headers": {
-            "Content-Type": "application/json"
-        }
-    }
-    
-    required_config_fields = ["baseURL", "timeout", "headers"]
-    is_valid_config = check_required_fields(api_config, required_config_fields)
-    print(format_test_result("API Service Config", is_valid_config))
-    
-    # Test API endpoints structure
-    api_endpoints = {
-        "auth": {
-            "register": "/auth/register",
-            "login": "/auth/login",
-            "me": "/auth/me"
-        },
-        "items": {
-            "list": "/items",
-            "create": "/items",
-            "get": "/items/{id}",
-            "update": "/items/{id}",
-            "delete": "/items/{id}"
-        }
-    }
-    
-    expected_endpoint_structure = ["auth", "items"]
-    is_valid_endpoints = validate_response_format(api_endpoints, expected_endpoint_structure)
-    print(format_test_result("API Endpoints Structure", is_valid_endpoints))
-
-
-def test_auth_context_behavior():
-    """Test AuthContext expected behaviors (from AuthContext.ts)"""
-    # Test authentication state structure
-    auth_state = {
-        "user": {
-            "id": "507f1f77bcf86cd799439011",
-            "username": "testuser",
-            "role": "user"
-        },
-        "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-        "isAuthenticated": True,
-        "loading": False
-    }
-    
-    required_auth_fields = ["user", "token", "isAuthenticated", "loading"]
-    is_valid_auth_state = check_required_fields(auth_state, required_auth_fields)
-    print(format_test_result("Auth Context State", is_valid_auth_state))
-    
-    # Test authentication actions
-    auth_actions = ["login", "logout", "register", "checkAuth"]
-    expected_actions = ["login", "logout", "register"]
-    has_required_actions = all(action in auth_actions for action in expected_actions)
-    print(format_test_result("Auth Context Actions", has_required_actions))
-
-
-def test_form_validation_scenarios():
-    """Test form validation scenarios (from SubmitForm.ts, ItemCreateForm.tsx)"""
-    # Test login form validation
-    login_form_data = {
-        "username": "testuser",
-        "password": "password123"
-    }
-    
-    required_login_fields = ["username", "password"]
-    is_valid_login_form = check_required_fields(login_form_data, required_login_fields)
-    print(format_test_result("Login Form Validation", is_valid_login_form))
-    
-    # Test registration form validation
-    register_form_data = {
-        "username": "newuser",
-        "password": "password123",
-        "confirmPassword": "password123"
-    }
-    
-    required_register_fields = ["username", "password", "confirmPassword"]
-    is_valid_register_form = check_required_fields(register_form_data, required_register_fields)
-    print(format_test_result("Register Form Validation", is_valid_register_form))
-    
-    # Test item creation form validation
-    item_form_data = {
-        "title": "New Item",
-        "content": "Item content here"
-    }
-    
-    required_item_fields = ["title", "content"]
-    is_valid_item_form = check_required_fields(item_form_data, required_item_fields)
-    print(format_test_result("Item Form Validation", is_valid_item_form))
+REQUIRED_ERROR_FIELDS = ("status", "message")
+HANDLED_ERROR_STATUSES = frozenset({400, 401, 403, 404, 500})
 
 
-def test_data_display_components():
-    """Test data display component behaviors (from DataDisplay.ts, SearchResults.ts)"""
-    # Test search results structure
-    search_results = {
-        "items": [
-            {
-                "id": "1",
-                "title": "Item 1",
-                "content": "Content 1",
-                "createdAt": "2024-01-01T00:00:00.000Z"
-            },
-            {
-                "id": "2",
-                "title": "Item 2",
-                "content": "Content 2",
-                "createdAt": "2024-01-02T00:00:00.000Z"
-            }
-        ],
-        "total": 2,
-        "page": 1,
-        "limit": 10
-    }
-    
-    required_search_fields = ["items", "total", "page", "limit"]
-    is_valid_search_results = check_required_fields(search_results, required_search_fields)
-    print(format_test_result("Search Results Structure", is_valid_search_results))
-    
-    # Test data display pagination
-    pagination_data = {
-        "currentPage": 1,
-        "totalPages": 5,
-        "totalItems": 50,
-        "itemsPerPage": 10
-    }
-    
-    required_pagination_fields = ["currentPage", "totalPages", "totalItems", "itemsPerPage"]
-    is_valid_pagination = check_required_fields(pagination_data, required_pagination_fields)
-    print(format_test_result("Pagination Structure", is_valid_pagination))
-
-
-def test_socket_service_integration():
-    """Test SocketService expected behaviors (from SocketService.ts)"""
-    # Test socket connection configuration
-    socket_config = {
-        "url": "ws://localhost:3000",
-        "autoConnect": True,
-        "reconnection": True,
-        "reconnectionAttempts": 5
-    }
-    
-    required_socket_fields = ["url", "autoConnect", "reconnection", "reconnectionAttempts"]
-    is_valid_socket_config = check_required_fields(socket_config, required_socket_fields)
-    print(format_test_result("Socket Service Config", is_valid_socket_config))
-    
-    # Test socket event types
-    socket_events = ["connect", "disconnect", "message", "error", "reconnect"]
-    expected_socket_events = ["connect", "disconnect", "message"]
-    has_required_events = all(event in socket_events for event in expected_socket_events)
-    print(format_test_result("Socket Event Types", has_required_events))
-
-
-def test_routing_behavior():
-    """Test routing behaviors (from router.ts)"""
-    # Test route structure
-    routes = {
-        "/": "Home",
-        "/login": "Login",
-        "/register": "Register",
-        "/items": "Items",
-        "/profile": "Profile",
-        "/not-found": "NotFound"
-    }
-    
-    required_routes = ["/", "/login", "/items"]
-    has_required_routes = all(route in routes for route in required_routes)
-    print(format_test_result("Route Structure", has_required_routes))
-    
-    # Test protected route behavior
-    protected_routes = ["/profile", "/items"]
-    public_routes = ["/", "/login", "/register"]
-    
-    test_user = {"isAuthenticated": True}
-    test_guest = {"isAuthenticated": False}
-    
-    # Test authenticated user access
-    can_access_protected = test_user["isAuthenticated"]
-    print(format_test_result("Protected Route - Authenticated", can_access_protected))
-    
-    # Test guest access to public routes
-    can_access_public = True  # Public routes should always be accessible
-    print(format_test_result("Public Route - Guest", can_access_public))
-
-
-def test_error_handling_scenarios():
+def test_error_handling_scenarios(api_errors):
     """Test error handling scenarios across frontend components"""
     # Test API error responses
-    api_errors = [
-        {
-            "status": 400,
-            "message": "Validation error",
-            "errors": ["Username is required"]
-        },
-        {
-            "status": 401,
-            "message": "Authentication required",
-            "code": "AUTH_REQUIRED"
-        },
-        {
-            "status": 403,
-            "message": "Insufficient permissions",
-            "code": "INSUFFICIENT_PERMISSIONS"
-        },
-        {
-            "status": 404,
-            "message": "Resource not found",
-            "code": "NOT_FOUND"
-        },
-        {
-            "status": 500,
-            "message": "Internal server error",
-            "code": "INTERNAL_ERROR"
-        }
-    ]
-    
     for error in api_errors:
-        required_error_fields = ["status", "message"]
-        is_valid_error = check_required_fields(error, required_error_fields)
-        print(format_test_result(f"API Error {error['status']}", is_valid_error))
-
-
-def test_user_experience_flows():
-    """Test user experience flows and interactions"""
-    # Test user registration flow
-    registration_flow = [
-        {"step": "form_fill", "data": {"username": "newuser", "password": "password123"}},
-        {"step": "validation", "status": "success"},
-        {"step": "api_call", "status": 201},
-        {"step": "redirect", "destination": "/login"}
-    ]
-    
-    flow_steps = [step["step"] for step in registration_flow]
-    expected_steps = ["form_fill", "validation", "api_call", "redirect"]
-    has_expected_steps = all(step in flow_steps for step in expected_steps)
-    print(format_test_result("Registration Flow", has_expected_steps))
-    
-    # Test user login flow
-    login_flow = [
-        {"step": "form_fill", "data": {"username": "user", "password": "password123"}},
-        {"step": "validation", "status": "success"},
-        {"step": "api_call", "status": 200},
-        {"step": "token_storage", "status": "success"},
-        {"step": "redirect", "destination": "/items"}
-    ]
-    
-    login_steps = [step["step"] for step in login_flow]
-    expected_login_steps = ["form_fill", "validation", "api_call", "token_storage", "redirect"]
-    has_expected_login_steps = all(step in login_steps for step in expected_login_steps)
-    print(format_test_result("Login Flow", has_expected_login_steps))
-
-
-def test_performance_scenarios():
-    """Test performance-related scenarios"""
-    # Test API response times
-    response_times = [
-        {"endpoint": "/api/auth/login", "time": 150, "expected": "< 200ms"},
-        {"endpoint": "/api/items", "time": 300, "expected": "< 500ms"},
-        {"endpoint": "/api/items/search", "time": 450, "expected": "< 1000ms"}
-    ]
-    
-    for response in response_times:
-        is_acceptable = response["time"] < int(response["expected"].split()[1].replace("ms", ""))
-        print(format_test_result(f"Response Time - {response['endpoint']}", 
-                               is_acceptable, 
-                               f"{response['time']}ms"))
-    
-    # Test data loading states
-    loading_states = [
-        {"component": "LoginForm", "loading": True, "disabled": True},
-        {"component": "ItemList", "loading": False, "disabled": False},
-        {"component": "SearchForm", "loading": True, "disabled": True}
-    ]
-    
-    for state in loading_states:
-        is_consistent = (state["loading"] == state["disabled"])
-        print(format_test_result(f"Loading State - {state['component']}", 
-                               is_consistent, 
-                               f"Loading: {state['loading']}, Disabled: {state['disabled']}"))
-
-
-def test_integration_workflows():
-    """Test complete integration workflows"""
-    start_time = datetime.now()
-    
-    # Workflow 1: User Registration → Login → Create Item → View Items
-    workflow_1_steps = [
-        {"action": "register", "status": "success"},
-        {"action": "login", "status": "success"},
-        {"action": "create_item", "status": "success"},
-        {"action": "view_items", "status": "success"}
-    ]
-    
-    workflow_1_success = all(step["status"] == "success" for step in workflow_1_steps)
-    print(format_test_result("Workflow 1 - User Journey", workflow_1_success, 
-                           "Register → Login → Create → View"))
-    
-    # Workflow 2: Search → Filter → Paginate → Sort
-    workflow_2_steps = [
-        {"action": "search", "status": "success"},
-        {"action": "filter", "status": "success"},
-        {"action": "paginate", "status": "success"},
-        {"action": "sort", "status": "success"}
-    ]
-    
-    workflow_2_success = all(step["status"] == "success" for step in workflow_2_steps)
-    print(format_test_result("Workflow 2 - Data Operations", workflow_2_success,
-                           "Search → Filter → Paginate → Sort"))
-    
-    # Workflow 3: Authentication → Authorization → Data Access → Logout
-    workflow_3_steps = [
-        {"action": "authenticate", "status": "success"},
-        {"action": "authorize", "status": "success"},
-        {"action": "access_data", "status": "success"},
-        {"action": "logout", "status": "success"}
-    ]
-    
-    workflow_3_success = all(step["status"] == "success" for step in workflow_3_steps)
-    print(format_test_result("Workflow 3 - Security Flow", workflow_3_success,
-                           "Auth → Authorize → Access → Logout"))
-    
-    end_time = datetime.now()
-    print(log_test_execution("Integration Workflows", start_time, end_time))
-
-
-if __name__ == "__main__":
-    print("Running Python frontend integration tests...")
-    print("=" * 60)
-    
-    test_api_service_structure()
-    print()
-    
-    test_auth_context_behavior()
-    print()
-    
-    test_form_validation_scenarios()
-    print()
-    
-    test_data_display_components()
-    print()
-    
-    test_socket_service_integration()
-    print()
-    
-    test_routing_behavior()
-    print()
-    
-    test_error_handling_scenarios()
-    print()
-    
-    test_user_experience_flows()
-    print()
-    
-    test_performance_scenarios()
-    print()
-    
-    test_integration_workflows()
-    print()
+        is_valid, missing = check_required_fields(error, REQUIRED_ERROR_FIELDS)
+        assert is_valid, f"API Error {error['status']} - Missing: {missing}"
     
-    print("=" * 60)
-    print("Frontend integration tests completed!")
+    # Every status in the table is one the frontend handles
+    unhandled = {error["status"] for error in api_errors} - HANDLED_ERROR_STATUSES
+    assert not unhandled, f"Unhandled statuses: {sorted(unhandled)}"
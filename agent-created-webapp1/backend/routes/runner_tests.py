@@ -0,0 +1,30 @@
+"""
+Python tests for the test runner's per-file result attribution
+Builds throwaway test files with pytester and runs them through run_all_tests
+"""
+import test_runner
+
+
+def test_run_all_tests_attributes_failures_per_file(pytester, monkeypatch, capsys):
+    """Test that one broken file is reported without failing the others"""
+    pytester.makepyfile(
+        test_passing="def test_ok():\n    assert True\n",
+        test_import_error="import nonexistent_mod\n\ndef test_never_runs():\n    pass\n",
+        test_failing="def test_fails():\n    assert False\n",
+    )
+    monkeypatch.setattr(test_runner, "_TEST_DIR", str(pytester.path))
+    monkeypatch.setattr(test_runner, "TEST_CATEGORIES", {
+        "passing": ("test_passing.py", "Passing Tests"),
+        "import_error": ("test_import_error.py", "Import Error Tests"),
+        "failing": ("test_failing.py", "Failing Tests"),
+        "missing": ("test_missing.py", "Missing Tests")
+    })
+    
+    assert not test_runner.run_all_tests()
+    
+    output = capsys.readouterr().out
+    assert "✅ PASS Passing Tests: Passing Tests completed successfully" in output
+    assert "❌ FAIL Import Error Tests: Import Error Tests failed" in output
+    assert "❌ FAIL Failing Tests: Failing Tests failed" in output
+    assert "❌ FAIL Missing Tests: Test file test_missing.py not found" in output
+    assert "Passed: 1" in output
@@ -1,34 +1,56 @@
+import sys
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+
 def validate_response_format(response_data, expected_keys):
     """
     Helper function to validate API response format
     
     Args:
         response_data (dict): The response data to validate
-        expected_keys (list): List of keys that should be present
+        expected_keys (iterable): Keys that should be present; pass a
+            module-level frozenset to avoid rebuilding the set per call
         
     Returns:
         bool: True if all expected keys are present, False otherwise
     """
-    return all(key in response_data for key in expected_keys)
+    return response_data.keys() >= frozenset(expected_keys)
+
+
+@lru_cache(maxsize=128)
+def _build_mock_request_data(item_name, user_id):
+    return MappingProxyType({
+        "name": item_name,
+        "user_id": user_id,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "description": f"Test description for {item_name}"
+    })
 
 
 def create_mock_request_data(item_name="test_item", user_id=1):
     """
     Helper function to create mock request data for testing
     
+    Results are cached per (item_name, user_id), so the returned mapping is
+    shared between callers and read-only. Copy it with dict() or {**data}
+    before adding fields.
+    
     Args:
         item_name (str): Name of the test item
         user_id (int): ID of the test user
         
     Returns:
-        dict: Mock request data structure
+        MappingProxyType: Read-only mock request data structure
     """
-    return {
-        "name": item_name,
-        "user_id": user_id,
-        "timestamp": "2024-01-01T00:00:00Z",
-        "description": f"Test description for {item_name}"
-    }
+    return _build_mock_request_data(item_name, user_id)
+
+
+_PASSED_TEMPLATE = "Test '{}': PASSED"
+_FAILED_TEMPLATE = "Test '{}': FAILED"
 
 
 def format_test_result(test_name, passed, details=None):
@@ -43,8 +65,178 @@ def format_test_result(test_name, passed, details=None):
     Returns:
         str: Formatted test result string
     """
-    status = "PASSED" if passed else "FAILED"
-    result = f"Test '{test_name}': {status}"
-    if details:
-        result += f" - {details}"
-    return result 
\ No newline at end of file
+    result = (_PASSED_TEMPLATE if passed else _FAILED_TEMPLATE).format(test_name)
+    return f"{result} - {details}" if details else result
+
+
+class Reporter:
+    """
+    Context manager that collects report lines and writes them in one call
+    
+    Every print() takes the stdout lock and may flush, so summaries built
+    from many lines are buffered here and emitted with a single write on exit.
+    
+    Args:
+        stream (file, optional): Destination stream, defaults to sys.stdout
+    """
+    
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.lines = []
+    
+    def add(self, line=""):
+        """Queue a line of output"""
+        self.lines.append(line)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.lines:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("\n".join(self.lines) + "\n")
+            self.lines = []
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class MockResponse:
+    """
+    Immutable simulated API response for flows whose outcome is constant
+    
+    Unlike simulate_api_response, instances are meant to be built once as
+    module-level constants and shared between tests. The payload is copied
+    into a read-only mapping so a shared instance cannot leak changes.
+    
+    Attributes:
+        status_code (int): HTTP status code
+        success (bool): Whether the request succeeded
+        data (Mapping): Read-only response data payload
+    """
+    status_code: int
+    success: bool
+    data: Mapping
+    
+    def __post_init__(self):
+        if not isinstance(self.data, MappingProxyType):
+            object.__setattr__(self, "data", MappingProxyType(dict(self.data)))
+
+
+# (second, formatted prefix) pair, replaced in one assignment so concurrent
+# callers never pair a new second with the previous second's prefix
+_iso_cache = (None, "")
+
+
+def _fast_iso():
+    """Local ISO-8601 timestamp with microseconds, like datetime.now().isoformat()"""
+    global _iso_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _iso_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_cache = (second, prefix)
+    return "%s.%06d" % (prefix, (now - second) * 1e6)
+
+
+def simulate_api_response(status_code=200, data=None, error_message=None):
+    """
+    Simulate an API response structure
+    
+    Args:
+        status_code (int): HTTP status code
+        data (dict): Response data payload
+        error_message (str): Error message if applicable
+        
+    Returns:
+        dict: Simulated API response
+    """
+    response = {
+        "status_code": status_code,
+        "timestamp": _fast_iso(),
+        "success": 200 <= status_code < 300
+    }
+    
+    if error_message is not None:
+        response["error"] = error_message
+    if data is not None:
+        response["data"] = data
+        
+    return response
+
+
+_USERNAME_TEMPLATE = "testuser%d"
+_EMAIL_TEMPLATE = "testuser%d@example.com"
+_ROLES = ("user", "admin")
+
+
+@lru_cache(maxsize=32)
+def _build_test_user_data(user_count):
+    users = []
+    for i in range(user_count):
+        user_id = i + 1
+        user = {
+            "id": user_id,
+            "username": _USERNAME_TEMPLATE % user_id,
+            "email": _EMAIL_TEMPLATE % user_id,
+            "role": _ROLES[i & 1],
+            "active": True
+        }
+        users.append(MappingProxyType(user))
+    
+    return tuple(users)
+
+
+def generate_test_user_data(user_count=1):
+    """
+    Generate test user data for testing
+    
+    Users are built once per user_count and cached; each call returns fresh
+    dict copies so callers may still modify them.
+    
+    Args:
+        user_count (int): Number of test users to generate
+        
+    Returns:
+        list: List of test user dictionaries
+    """
+    users = [dict(user) for user in _build_test_user_data(user_count)]
+    return users if user_count > 1 else users[0] if users else None
+
+
+# Values treated as missing; False and 0 are legitimate field values
+_EMPTY_VALUES = (None, "")
+
+
+def check_required_fields(data, required_fields):
+    """
+    Check if all required fields are present and not None/empty
+    
+    Args:
+        data (dict): Data to check
+        required_fields (list): List of required field names
+        
+    Returns:
+        tuple: (is_valid, missing_fields)
+    """
+    missing_fields = [name for name in required_fields if data.get(name) in _EMPTY_VALUES]
+    return not missing_fields, missing_fields
+
+
+def log_test_execution(test_name, start_ns=None, end_ns=None):
+    """
+    Log test execution details
+    
+    Args:
+        test_name (str): Name of the test
+        start_ns (int): Test start time from time.perf_counter_ns()
+        end_ns (int): Test end time from time.perf_counter_ns()
+        
+    Returns:
+        str: Formatted log message
+    """
+    if start_ns is not None and end_ns is not None:
+        duration = (end_ns - start_ns) / 1e9
+        return f"Test '{test_name}' executed in {duration:.3f} seconds"
+    else:
+        return f"Test '{test_name}' logged at {_fast_iso()}"
\ No newline at end of file
@@ -1,123 +1,153 @@
-from test_helpers import validate_response_format, create_mock_request_data, format_test_result
-from test_utilities import simulate_api_response, generate_test_user_data, check_required_fields, log_test_execution
+import dataclasses
+import io
+import time
+from datetime import datetime
+import pytest
+from test_helpers import (
+    validate_response_format, create_mock_request_data, format_test_result, Reporter,
+    MockResponse, simulate_api_response, generate_test_user_data, check_required_fields, log_test_execution,
+)
+
+
+_REQUIRED_MOCK_FIELDS = frozenset({"name", "user_id", "timestamp"})
+_REQUIRED_PROCESSED_FIELDS = frozenset({"id", "name", "user_id", "status"})
 
 
 def test_response_validation():
     """Test that demonstrates using the response validation helper function"""
     # Test case 1: Valid response with all expected keys
     mock_response = {
-        "id": 1, 
-        "name": "test_item", 
+        "id": 1,
+        "name": "test_item",
         "status": "active",
         "created_at": "2024-01-01"
     }
     expected_keys = ["id", "name", "status"]
-    
-    result = validate_response_format(mock_response, expected_keys)
-    print(format_test_result("Response Validation - Valid Keys", result))
-    
+
+    assert validate_response_format(mock_response, expected_keys)
+
     # Test case 2: Invalid response missing keys
     incomplete_response = {"id": 1, "name": "test_item"}
     expected_keys_full = ["id", "name", "status", "description"]
-    
-    result = validate_response_format(incomplete_response, expected_keys_full)
-    print(format_test_result("Response Validation - Missing Keys", not result, "Expected failure"))
+
+    assert not validate_response_format(incomplete_response, expected_keys_full)
 
 
 def test_mock_data_creation():
     """Test that demonstrates using the mock data creation helper"""
     # Test default parameters
     default_mock = create_mock_request_data()
-    has_required_fields = all(key in default_mock for key in ["name", "user_id", "timestamp"])
-    print(format_test_result("Mock Data Creation - Default", has_required_fields))
-    
+    assert default_mock.keys() >= _REQUIRED_MOCK_FIELDS
+
     # Test custom parameters
     custom_mock = create_mock_request_data("custom_item", 999)
-    is_custom_correct = (custom_mock["name"] == "custom_item" and 
-                        custom_mock["user_id"] == 999)
-    print(format_test_result("Mock Data Creation - Custom", is_custom_correct))
-    
-    print(f"Custom mock data: {custom_mock}")
+    assert custom_mock["name"] == "custom_item"
+    assert custom_mock["user_id"] == 999
+    assert custom_mock["description"] == "Test description for custom_item"
+
+    # Repeated calls share one cached, read-only mapping
+    assert create_mock_request_data("custom_item", 999) is custom_mock
+    with pytest.raises(TypeError):
+        custom_mock["name"] = "changed"
 
 
 def test_integration_scenario():
     """Test that combines multiple helper functions"""
     # Create mock data using helper
     test_data = create_mock_request_data("integration_test", 42)
-    
+
     # Simulate processing the data (add an ID like an API would)
     processed_data = {**test_data, "id": 1, "status": "processed"}
-    
+
     # Validate the processed response
-    required_fields = ["id", "name", "user_id", "status"]
-    validation_result = validate_response_format(processed_data, required_fields)
-    
-    print(format_test_result("Integration Test", validation_result, 
-                           "Mock creation → Processing → Validation"))
+    assert validate_response_format(processed_data, _REQUIRED_PROCESSED_FIELDS)
+
+
+def test_format_test_result():
+    """Test the consistent test result formatting helper"""
+    assert format_test_result("Example", True) == "Test 'Example': PASSED"
+    assert format_test_result("Example", False, "Expected failure") == "Test 'Example': FAILED - Expected failure"
+    assert format_test_result("Example", False, ["email"]) == "Test 'Example': FAILED - ['email']"
+
+
+def test_reporter_batches_output():
+    """Test that the reporter writes all queued lines in a single call on exit"""
+    stream = io.StringIO()
+    with Reporter(stream) as reporter:
+        reporter.add(format_test_result("First", True))
+        reporter.add(format_test_result("Second", False))
+        assert stream.getvalue() == ""
+
+    assert stream.getvalue() == "Test 'First': PASSED\nTest 'Second': FAILED\n"
 
 
 def test_api_utilities():
     """Test that demonstrates using the API utility functions"""
     # Generate test user data
     test_user = generate_test_user_data(1)
-    print(format_test_result("User Data Generation", test_user is not None))
-    
+    assert test_user is not None
+
     # Test multiple users
     multiple_users = generate_test_user_data(3)
-    has_three_users = isinstance(multiple_users, list) and len(multiple_users) == 3
-    print(format_test_result("Multiple User Generation", has_three_users))
+    assert isinstance(multiple_users, list) and len(multiple_users) == 3
     
+    # Cached users are handed out as independent copies
+    multiple_users[0]["username"] = "changed"
+    assert generate_test_user_data(3)[0]["username"] == "testuser1"
+
     # Simulate successful API response
     success_response = simulate_api_response(200, {"user": test_user})
-    is_success = success_response["success"] and "data" in success_response
-    print(format_test_result("API Response - Success", is_success))
+    assert success_response["success"] and "data" in success_response
+    assert datetime.fromisoformat(success_response["timestamp"])
+
+    # An empty payload is still a payload
+    empty_response = simulate_api_response(200, {})
+    assert empty_response["data"] == {} and "error" not in empty_response
     
     # Simulate error API response
     error_response = simulate_api_response(404, error_message="User not found")
-    is_error = not error_response["success"] and "error" in error_response
-    print(format_test_result("API Response - Error", is_error))
+    assert not error_response["success"] and "error" in error_response
+
+
+def test_mock_response_is_frozen():
+    """Test that shared mock responses cannot be mutated between tests"""
+    response = MockResponse(201, True, {"id": 1})
+    assert response.success == simulate_api_response(201)["success"]
+    assert not hasattr(response, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        response.success = False
+    
+    # The payload is copied and read-only, so shared constants stay intact
+    with pytest.raises(TypeError):
+        response.data["leak"] = 1
+    assert response.data == {"id": 1}
 
 
 def test_field_validation():
     """Test field validation using utilities"""
-    from datetime import datetime
-    
-    start_time = datetime.now()
-    
+    start_ns = time.perf_counter_ns()
+
     # Test complete user data
     complete_user = generate_test_user_data(1)
     required_user_fields = ["id", "username", "email", "role"]
-    
+
     is_valid, missing = check_required_fields(complete_user, required_user_fields)
-    print(format_test_result("Field Validation - Complete", is_valid))
-    
+    assert is_valid
+    assert missing == []
+
     # Test incomplete data
     incomplete_data = {"id": 1, "username": "test"}
-    is_invalid, missing_fields = check_required_fields(incomplete_data, required_user_fields)
-    print(format_test_result("Field Validation - Incomplete", not is_invalid, f"Missing: {missing_fields}"))
-    
-    end_time = datetime.now()
-    print(log_test_execution("Field Validation Tests", start_time, end_time))
+    is_valid, missing_fields = check_required_fields(incomplete_data, required_user_fields)
+    assert not is_valid
+    assert missing_fields == ["email", "role"]
 
-
-if __name__ == "__main__":
-    print("Running Python test suite for routes...")
-    print("=" * 50)
-    
-    test_response_validation()
-    print()
-    
-    test_mock_data_creation()
-    print()
-    
-    test_integration_scenario()
-    print()
-    
-    test_api_utilities()
-    print()
-    
-    test_field_validation()
-    print()
-    
-    print("=" * 50)
-    print("Test suite completed!") 
\ No newline at end of file
+    # Falsy but real values count as present; None and "" do not
+    flags = {"id": 0, "active": False, "email": "", "role": None}
+    is_valid, missing_fields = check_required_fields(flags, ["id", "active", "email", "role"])
+    assert not is_valid
+    assert missing_fields == ["email", "role"]
+    
+    end_ns = time.perf_counter_ns()
+    assert log_test_execution("Field Validation Tests", start_ns, end_ns).startswith(
+        "Test 'Field Validation Tests' executed in ")
+    assert log_test_execution("Untimed").startswith("Test 'Untimed' logged at ")
@@ -4,142 +4,124 @@ Runs all test files and provides a summary of results
 """
 import sys
 import os
-from datetime import datetime
-from test_helpers import format_test_result
-from test_utilities import log_test_execution
+import time
+import pytest
+from test_helpers import Reporter, log_test_execution
+
+
+# Test files are resolved next to this module so the runner works from any directory
+_TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Single source of truth for the suite: category -> (test file, display name)
+TEST_CATEGORIES = {
+    "routes": ("test_routes.py", "Core Route Tests"),
+    "models": ("model_tests.py", "Model & Route Integration Tests"),
+    "frontend": ("frontend_integration_tests.py", "Frontend Integration Tests"),
+    "runner": ("runner_tests.py", "Test Runner Tests")
+}
 
 
 def run_test_file(test_file, test_name):
-    """Run a specific test file and capture results"""
+    """Run a specific test file through pytest and capture results"""
     print(f"\n{'='*20} {test_name} {'='*20}")
     
     try:
-        # Import and run the test file
-        if test_file == "test_routes.py":
-            from test_routes import (
-                test_response_validation,
-                test_mock_data_creation,
-                test_integration_scenario,
-                test_api_utilities,
-                test_field_validation
-            )
-            
-            test_response_validation()
-            test_mock_data_creation()
-            test_integration_scenario()
-            test_api_utilities()
-            test_field_validation()
-            
-        elif test_file == "model_tests.py":
-            from model_tests import (
-                test_user_model_structure,
-                test_item_model_structure,
-                test_auth_routes_responses,
-                test_jwt_token_structure,
-                test_error_responses,
-                test_database_operations,
-                test_role_based_authorization,
-                test_integration_scenarios
-            )
-            
-            test_user_model_structure()
-            test_item_model_structure()
-            test_auth_routes_responses()
-            test_jwt_token_structure()
-            test_error_responses()
-            test_database_operations()
-            test_role_based_authorization()
-            test_integration_scenarios()
-            
-        elif test_file == "frontend_integration_tests.py":
-            from frontend_integration_tests import (
-                test_api_service_structure,
-                test_auth_context_behavior,
-                test_form_validation_scenarios,
-                test_data_display_components,
-                test_socket_service_integration,
-                test_routing_behavior,
-                test_error_handling_scenarios,
-                test_user_experience_flows,
-                test_performance_scenarios,
-                test_integration_workflows
-            )
-            
-            test_api_service_structure()
-            test_auth_context_behavior()
-            test_form_validation_scenarios()
-            test_data_display_components()
-            test_socket_service_integration()
-            test_routing_behavior()
-            test_error_handling_scenarios()
-            test_user_experience_flows()
-            test_performance_scenarios()
-            test_integration_workflows()
+        exit_code = pytest.main([os.path.join(_TEST_DIR, test_file)])
         
-        return True, f"{test_name} completed successfully"
+        if exit_code == pytest.ExitCode.OK:
+            return True, f"{test_name} completed successfully"
+        return False, f"{test_name} failed: pytest exited with {exit_code!r}"
         
     except Exception as e:
         return False, f"{test_name} failed: {str(e)}"
 
 
+class _FileResultCollector:
+    """pytest plugin that records which test files had a failing test"""
+    
+    def __init__(self):
+        self.failed_files = set()
+    
+    def _record(self, report):
+        if report.failed:
+            self.failed_files.add(os.path.basename(report.nodeid.split("::", 1)[0]))
+    
+    def pytest_runtest_logreport(self, report):
+        self._record(report)
+    
+    def pytest_collectreport(self, report):
+        self._record(report)
+
+
 def run_all_tests():
-    """Run all test files and provide summary"""
-    start_time = datetime.now()
+    """Run all test files in a single pytest session and provide summary"""
+    start_ns = time.perf_counter_ns()
     
     print("🚀 Starting Comprehensive Test Suite")
     print("=" * 60)
     
-    # Define test files to run
-    test_files = [
-        ("test_routes.py", "Core Route Tests"),
-        ("model_tests.py", "Model & Route Integration Tests"),
-        ("frontend_integration_tests.py", "Frontend Integration Tests")
-    ]
+    test_files = list(TEST_CATEGORIES.values())
+    
+    # One pytest invocation for every file amortizes startup, plugin
+    # loading and collection instead of paying them once per file;
+    # --continue-on-collection-errors keeps an import error in one file
+    # from aborting the others, and the collector attributes it per file
+    existing_files = [test_file for test_file, _ in test_files
+                      if os.path.exists(os.path.join(_TEST_DIR, test_file))]
+    collector = _FileResultCollector()
+    args = [os.path.join(_TEST_DIR, test_file) for test_file in existing_files]
+    args.append("--continue-on-collection-errors")
+    exit_code = pytest.main(args, plugins=[collector]) if existing_files else None
+    session_ok = exit_code in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
     
     results = []
     total_tests = 0
     passed_tests = 0
     
     for test_file, test_name in test_files:
-        if os.path.exists(test_file):
-            success, message = run_test_file(test_file, test_name)
-            results.append({
-                "file": test_file,
-                "name": test_name,
-                "success": success,
-                "message": message
-            })
-            
-            if success:
-                passed_tests += 1
-            total_tests += 1
+        if test_file not in existing_files:
+            message = f"Test file {test_file} not found"
+            success = False
+        elif not session_ok:
+            message = f"{test_name} failed: pytest exited with {exit_code!r}"
+            success = False
+        elif test_file in collector.failed_files:
+            message = f"{test_name} failed"
+            success = False
         else:
-            results.append({
-                "file": test_file,
-                "name": test_name,
-                "success": False,
-                "message": f"Test file {test_file} not found"
-            })
-            total_tests += 1
+            message = f"{test_name} completed successfully"
+            success = True
+        
+        results.append({
+            "file": test_file,
+            "name": test_name,
+            "success": success,
+            "message": message
+        })
+        
+        if success:
+            passed_tests += 1
+        total_tests += 1
     
-    end_time = datetime.now()
+    end_ns = time.perf_counter_ns()
     
     # Print summary
-    print("\n" + "=" * 60)
-    print("📊 TEST SUMMARY")
-    print("=" * 60)
-    
-    for result in results:
-        status = "✅ PASS" if result["success"] else "❌ FAIL"
-        print(f"{status} {result['name']}: {result['message']}")
-    
-    print(f"\n📈 Overall Results:")
-    print(f"   Total Test Files: {total_tests}")
-    print(f"   Passed: {passed_tests}")
-    print(f"   Failed: {total_tests - passed_tests}")
-    print(f"   Success Rate: {(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "   Success Rate: 0%")
-    
-    print(f"\n⏱️  Total Execution Time: {log_test_execution('Complete Test Suite', start_time, end_time)}")
+    with Reporter() as reporter:
+        reporter.add("\n" + "=" * 60)
+        reporter.add("📊 TEST SUMMARY")
+        reporter.add("=" * 60)
+        
+        for result in results:
+            status = "✅ PASS" if result["success"] else "❌ FAIL"
+            reporter.add(f"{status} {result['name']}: {result['message']}")
+        
+        reporter.add("\n📈 Overall Results:")
+        reporter.add(f"   Total Test Files: {total_tests}")
+        reporter.add(f"   Passed: {passed_tests}")
+        reporter.add(f"   Failed: {total_tests - passed_tests}")
+        reporter.add(f"   Success Rate: {(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "   Success Rate: 0%")
+        
+        reporter.add(f"\n⏱️  Total Execution Time: {log_test_execution('Complete Test Suite', start_ns, end_ns)}")
     
     # Return overall success
     return passed_tests == total_tests
@@ -147,23 +129,18 @@ def run_all_tests():
 
 def run_specific_test_category(category):
     """Run tests for a specific category"""
-    categories = {
-        "routes": ("test_routes.py", "Core Route Tests"),
-        "models": ("model_tests.py", "Model & Route Integration Tests"),
-        "frontend": ("frontend_integration_tests.py", "Frontend Integration Tests")
-    }
-    
-    if category not in categories:
+    if category not in TEST_CATEGORIES:
         print(f"❌ Unknown test category: {category}")
-        print(f"Available categories: {', '.join(categories.keys())}")
+        print(f"Available categories: {', '.join(TEST_CATEGORIES)}")
         return False
     
-    test_file, test_name = categories[category]
+    test_file, test_name = TEST_CATEGORIES[category]
     success, message = run_test_file(test_file, test_name)
     
-    print(f"\n📊 {test_name} Results:")
-    print(f"   Status: {'✅ PASS' if success else '❌ FAIL'}")
-    print(f"   Message: {message}")
+    with Reporter() as reporter:
+        reporter.add(f"\n📊 {test_name} Results:")
+        reporter.add(f"   Status: {'✅ PASS' if success else '❌ FAIL'}")
+        reporter.add(f"   Message: {message}")
     
     return success
 